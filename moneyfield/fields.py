@@ -1,14 +1,18 @@
+import copy
 import decimal
 import re
-from collections import OrderedDict
+import sys
 from distutils.version import StrictVersion
+from functools import lru_cache
+from operator import attrgetter
 
-from django.utils.functional import cached_property
+from django.utils.functional import SimpleLazyObject, cached_property
 from django.utils.translation import to_locale, get_language
 from django import forms
 from django.core.exceptions import FieldError, ValidationError
 from django.db import models
 from django.db.models import NOT_PROVIDED
+from django.db.models.signals import class_prepared
 from django.forms.models import ModelFormMetaclass
 from django.utils.encoding import force_str
 import money
@@ -19,7 +23,11 @@ try:
     BABEL_VERSION = StrictVersion(babel.__version__)
     LC_NUMERIC = babel.default_locale('LC_NUMERIC')
 except ImportError:
-    babel = LC_NUMERIC = None
+    babel = BABEL_VERSION = LC_NUMERIC = None
+
+# Resolved once at import, MoneyLC.format() runs for every rendered amount.
+BABEL_AVAILABLE = babel is not None and BABEL_VERSION >= StrictVersion('2.2')
+_format_currency = babel.numbers.format_currency if BABEL_AVAILABLE else None
 
 
 from moneyfield.exceptions import *
@@ -27,50 +35,103 @@ from moneyfield.exceptions import *
 __all__ = ['MoneyField', 'MoneyModelForm', 'MoneyLC']
 
 
-REGEX_CURRENCY_CODE = re.compile("^[A-Z]{3}$")
+# Compiled on first use, currency_code_validator does not need it.
+# Its "$" also accepts a trailing newline, is_currency_code() does not.
+REGEX_CURRENCY_CODE = SimpleLazyObject(lambda: re.compile("^[A-Z]{3}$"))
+
+QUANTIZE_00 = decimal.Decimal('.00')
+
+# Locales Babel does not know, MoneyLC.__str__() goes straight to the
+# plain Money representation for them.
+_unknown_locales = set()
+
+
+# MoneyLC._from_db() sets the attributes money.Money keeps its state in.
+if set(vars(money.Money('0', 'EUR'))) != {'_amount', '_currency'}:
+    raise ImportError('Unsupported money version: Money instances are '
+                      'expected to store only "_amount" and "_currency".')
+
+
+@lru_cache(maxsize=16)
+def _lang_to_locale(language):
+    """to_locale() shared by all MoneyLC instances."""
+    return to_locale(language)
 
 
 class MoneyLC(money.Money):
 
-    @cached_property
+    @property
     def language_locale(self):
-        return to_locale(get_language())
+        return _lang_to_locale(get_language())
 
-    @property
+    @classmethod
+    def _from_db(cls, amount, currency):
+        """Build an instance from a Decimal amount and a valid currency code,
+        skipping the conversion and validation of Money.__init__().
+        """
+        self = object.__new__(cls)
+        self._amount = amount
+        self._currency = currency
+        return self
+
+    @cached_property
     def _amount_00_prec(self):
         """Two decimal places down for better accuracy in monetary values.
         1.9867272 -> 1.98
+
+        Cached per instance, Money amounts are never changed in place.
         """
-        return self._amount.quantize(decimal.Decimal('.00'), rounding=decimal.ROUND_DOWN)
+        return self._amount.quantize(QUANTIZE_00, rounding=decimal.ROUND_DOWN)
 
     def format(self, locale=LC_NUMERIC, pattern=None, currency_digits=True,
                format_type='standard', **options):
-        if babel:
-            if BABEL_VERSION < StrictVersion('2.2'):
+        if _format_currency is None:
+            if babel:
                 raise Exception('Babel {} is unsupported. '
                                 'Please upgrade to 2.2 or higher.'.format(BABEL_VERSION))
-            return babel.numbers.format_currency(
-                self._amount_00_prec, self._currency, format=pattern, locale=locale,
-                currency_digits=currency_digits, format_type=format_type,
-                **options)
-        else:
             raise NotImplementedError("formatting requires Babel "
                                       "(https://pypi.python.org/pypi/Babel)")
-
-    def __str__(self):
-        if babel:
+        return _format_currency(
+            self._amount_00_prec, self._currency, format=pattern, locale=locale,
+            currency_digits=currency_digits, format_type=format_type,
+            **options)
+
+    # Without Babel money.Money.__str__() is used as is.
+    if BABEL_AVAILABLE:
+        def __str__(self):
             # noinspection PyBroadException
             try:
-                return self.format(self.language_locale,
-                                   decimal_quantization=False)
+                locale = _lang_to_locale(get_language())
+                if locale not in _unknown_locales:
+                    return self.format(locale, decimal_quantization=False)
+            except babel.UnknownLocaleError:
+                # Does not depend on the value, remember it
+                _unknown_locales.add(locale)
             except Exception as exc:
-                return super().__str__()
-        else:
-            return super().__str__()
+                pass
+            return money.Money.__str__(self)
+
+
+def intern_currency(currency):
+    """Shared copy of a currency code, str subclasses are kept as they are"""
+    if type(currency) is str:
+        return sys.intern(currency)
+    return currency
+
+
+def is_currency_code(code):
+    """Three uppercase ASCII letters, without entering the regex engine.
+
+    Unlike REGEX_CURRENCY_CODE.match(), which lets "$" match before a
+    trailing newline, "EUR\\n" is rejected.
+    """
+    return (len(code) == 3 and
+            code.isascii() and code.isalpha() and code.isupper())
 
 
 def currency_code_validator(value):
-    if not REGEX_CURRENCY_CODE.match(force_str(value)):
+    code = value if type(value) is str else force_str(value)
+    if not is_currency_code(code):
         raise ValidationError('Invalid currency code.')
 
 
@@ -80,85 +141,92 @@ class MoneyModelFormMetaclass(ModelFormMetaclass):
         if name == 'MoneyModelForm':
             return new_class
 
-        money_fields = set()
-        # will support at most one level of inheritance.
-        for model_cls in new_class._meta.model.mro()[:2]:
-            if (model_opts := getattr(model_cls, '_meta', None)) and hasattr(model_opts, 'money_fields'):
-                money_fields.update(model_opts.money_fields)
-
+        # Inherited MoneyFields are already collected by inherit_money_fields()
         model_opts = new_class._meta.model._meta
-        model_opts.money_fields = money_fields
-
-        if not model_opts.money_fields:
+        if not getattr(model_opts, 'money_fields', None):
             raise MoneyModelFormError("The Model used with this ModelForm "
                                       "does not contain MoneyFields")
 
         # Rebuild the dict of form fields by replacing fields derived from
         # money subfields with a specialised money multivalue form field,
         # while preserving the original ordering.
-        fields = OrderedDict()
+        # Amount subfields map to their MoneyField, currency subfields
+        # map to None and are dropped.
+        subfields = {}
+        for money_field in model_opts.money_fields:
+            subfields[money_field.amount_attr] = money_field
+            if money_field.currency_attr:
+                subfields[money_field.currency_attr] = None
+        fields = {}
         for field_name, field in new_class.base_fields.items():
-            for money_field in model_opts.money_fields:
-                if field_name == money_field.amount_attr:
-                    fields[money_field.name] = money_field.formfield()
-                    break
-                if field_name == money_field.currency_attr:
-                    break
-            else:
+            if field_name not in subfields:
                 fields[field_name] = field
+            elif (money_field := subfields[field_name]) is not None:
+                fields[money_field.name] = money_field.formfield()
         
         new_class.base_fields = fields
+        new_class._money_field_names = tuple(
+            mf.name for mf in model_opts.money_fields)
+        new_class._money_field_getter = attrgetter(
+            *new_class._money_field_names)
+        new_class._money_subfield_pairs = tuple(
+            (mf.amount_attr, mf.currency_attr)
+            for mf in model_opts.money_fields if not mf.fixed_currency)
         return new_class
 
 
 class MoneyModelForm(forms.ModelForm, metaclass=MoneyModelFormMetaclass):
+    # Set by the metaclass: names of the model's MoneyFields and an
+    # attrgetter for them, and (amount, currency) subfield names of those
+    # with variable currency
+    _money_field_names = ()
+    _money_field_getter = None
+    _money_subfield_pairs = ()
+    
     def __init__(self, *args, initial: dict = None, instance=None, **kwargs):
-        opts = self._meta
-        model_opts = opts.model._meta
         if initial is None:
             initial = {}
-        if instance:
+        if instance and self._money_field_names:
             # Populate the multivalue form field using the initial dict,
             # as model_to_dict() only sees the model's _meta.fields
-            for money_field in model_opts.money_fields:
-                initial.update({
-                    money_field.name: getattr(instance, money_field.name)}
-                )
+            names = self._money_field_names
+            values = self._money_field_getter(instance)
+            if len(names) == 1:
+                initial[names[0]] = values
+            else:
+                initial.update(zip(names, values))
         
         super().__init__(*args, initial=initial, instance=instance, **kwargs)
         
         # Money "subfields" cannot be excluded separately
-        if opts.exclude:
-            for money_field in model_opts.money_fields:
-                if not money_field.fixed_currency:
-                    if not ((money_field.amount_attr in opts.exclude) == 
-                            (money_field.currency_attr in opts.exclude)):
-                        msg = ('Cannot exclude only one money field '
-                               'from the model form.')
-                        raise MoneyModelFormError(msg)
+        if self._meta.exclude:
+            exclude = frozenset(self._meta.exclude)
+            for amount_attr, currency_attr in self._money_subfield_pairs:
+                if (amount_attr in exclude) != (currency_attr in exclude):
+                    msg = ('Cannot exclude only one money field '
+                           'from the model form.')
+                    raise MoneyModelFormError(msg)
     
     def clean(self):
         cleaned_data = super().clean()
         # Finish the work of forms.models.construct_instance() as it doesn't
         # find match between the form multivalue field (e.g. "price"), and the
         # model's _meta.fields (e.g. "price_amount" and "price_currency").
-        opts = self._meta
-        model_opts = opts.model._meta
-        for money_field in model_opts.money_fields:
-            if money_field.name in self.cleaned_data:
-                value = self.cleaned_data[money_field.name]
+        for name in self._money_field_names:
+            if name in self.cleaned_data:
+                value = self.cleaned_data[name]
                 if value:
-                    setattr(self.instance, money_field.name, value)
+                    setattr(self.instance, name, value)
         
         return cleaned_data
 
 
 class MoneyWidget(forms.MultiWidget):
     def decompress(self, value):
-        if isinstance(value, money.Money):
-            return [value.amount, value.currency]
         if value is None:
             return [None, None]
+        if isinstance(value, money.Money):
+            return [value.amount, value.currency]
         raise TypeError('MoneyWidgets accept only Money.')
     
     def format_output(self, rendered_widgets):
@@ -225,62 +293,99 @@ class FixedCurrencyFormField(forms.Field):
 
 class AbstractMoneyProxy:
     """Object descriptor for MoneyFields"""
+    __slots__ = ('field', '_amount_attr')
+    
     def __init__(self, field):
         self.field = field
+        # Bound once, read on every attribute access
+        self._amount_attr = field.amount_attr
     
-    def _get_values(self, obj):
+    def __get__(self, obj, model):
+        """Return a Money object if called in a model instance"""
         raise NotImplementedError()
     
-    def _set_values(self, obj, amount, currency):
+    def __set__(self, obj, value):
+        """Set amount and currency attributes in the model instance"""
         raise NotImplementedError()
     
+    def _invalid_value(self, value):
+        msg = 'Cannot assign "{}" to MoneyField "{}".'
+        return TypeError(msg.format(type(value), self.field.name))
+
+
+class SimpleMoneyProxy(AbstractMoneyProxy):
+    """Descriptor for MoneyFields with fixed currency"""
+    __slots__ = ('_fixed_currency', '_trusted_currency', '_currency_error',
+                 '_accepts_decimal')
+    
+    def __init__(self, field):
+        super().__init__(field)
+        self._fixed_currency = field.fixed_currency
+        self._trusted_currency = (type(field.fixed_currency) is str and
+                                  is_currency_code(field.fixed_currency))
+        self._currency_error = 'Field "{}" is {}-only.'.format(
+            field.name, field.fixed_currency)
+        # Without an amount proxy the field also takes plain Decimals
+        self._accepts_decimal = not field.amount_proxy
+    
     def __get__(self, obj, model):
         """Return a Money object if called in a model instance"""
         if obj is None:
             return self.field
-        amount, currency = self._get_values(obj)
-        if amount is None or currency is None:
+        amount = obj.__dict__[self._amount_attr]
+        if amount is None:
             return None
-        return MoneyLC(amount, currency)
+        if type(amount) is decimal.Decimal and self._trusted_currency:
+            return MoneyLC._from_db(amount, self._fixed_currency)
+        return MoneyLC(amount, self._fixed_currency)
     
     def __set__(self, obj, value):
-        """Set amount and currency attributes in the model instance"""
+        """Set the amount attribute in the model instance"""
         if isinstance(value, money.Money):
-            self._set_values(obj, value.amount, value.currency)
+            if value.currency != self._fixed_currency:
+                raise TypeError(self._currency_error)
+            obj.__dict__[self._amount_attr] = value.amount
         elif value is None:
-            self._set_values(obj, None, None)
-        elif self.field.fixed_currency and not self.field.amount_proxy and isinstance(value, decimal.Decimal):
-            self._set_values(obj, value)
+            obj.__dict__[self._amount_attr] = None
+        elif self._accepts_decimal and isinstance(value, decimal.Decimal):
+            obj.__dict__[self._amount_attr] = value
         else:
-            msg = 'Cannot assign "{}" to MoneyField "{}".'
-            raise TypeError(msg.format(type(value), self.field.name))
-
-
-class SimpleMoneyProxy(AbstractMoneyProxy):
-    """Descriptor for MoneyFields with fixed currency"""
-    def _get_values(self, obj):
-        return (obj.__dict__[self.field.amount_attr],
-                self.field.fixed_currency)
-    
-    def _set_values(self, obj, amount, currency=None):
-        if currency is not None:
-            if currency != self.field.fixed_currency:
-                raise TypeError('Field "{}" is {}-only.'.format(
-                    self.field.name, 
-                    self.field.fixed_currency
-                ))
-        obj.__dict__[self.field.amount_attr] = amount
+            raise self._invalid_value(value)
 
 
 class CompositeMoneyProxy(AbstractMoneyProxy):
     """Descriptor for MoneyFields with variable currency"""
-    def _get_values(self, obj):
-        return (obj.__dict__[self.field.amount_attr],
-                obj.__dict__[self.field.currency_attr])
+    __slots__ = ('_currency_attr',)
+    
+    def __init__(self, field):
+        super().__init__(field)
+        self._currency_attr = field.currency_attr
+    
+    def __get__(self, obj, model):
+        """Return a Money object if called in a model instance"""
+        if obj is None:
+            return self.field
+        values = obj.__dict__
+        amount = values[self._amount_attr]
+        currency = values[self._currency_attr]
+        if amount is None or currency is None:
+            return None
+        if (type(amount) is decimal.Decimal and type(currency) is str and
+                is_currency_code(currency)):
+            return MoneyLC._from_db(amount, currency)
+        return MoneyLC(amount, currency)
     
-    def _set_values(self, obj, amount, currency):
-        obj.__dict__[self.field.amount_attr] = amount
-        obj.__dict__[self.field.currency_attr] = currency
+    def __set__(self, obj, value):
+        """Set amount and currency attributes in the model instance"""
+        values = obj.__dict__
+        if isinstance(value, money.Money):
+            values[self._amount_attr] = value.amount
+            values[self._currency_attr] = intern_currency(value.currency)
+        elif value is None:
+            values[self._amount_attr] = None
+            values[self._currency_attr] = None
+        else:
+            raise self._invalid_value(value)
 
 
 class MoneyDecimalField(models.DecimalField):
@@ -291,6 +396,20 @@ class MoneyDecimalField(models.DecimalField):
         return super().to_python(value)
 
 
+class MoneyCurrencyField(models.CharField):
+    """Currency column for MoneyFields with variable currency"""
+    def from_db_value(self, value, expression, connection):
+        # Only a few currency codes repeat over all the rows, share them
+        if value is None:
+            return value
+        return sys.intern(value)
+    
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        # Migrations keep seeing a regular CharField
+        return name, 'django.db.models.CharField', args, kwargs
+
+
 class MoneyField(models.Field):
     description = "Money"
     
@@ -304,7 +423,7 @@ class MoneyField(models.Field):
                  **kwargs):
         
         super().__init__(verbose_name, name, default=default, **kwargs)
-        self.fixed_currency = currency
+        self.fixed_currency = intern_currency(currency)
         self.amount_proxy = amount_proxy
 
         # DecimalField pre-validation
@@ -351,10 +470,13 @@ class MoneyField(models.Field):
                        'of type Money, it is "{}".')
                 raise TypeError(msg.format(self.name, type(currency)))
 
-        amount_options = kwargs.copy()
         if self.fixed_currency and not self.amount_proxy:
-            amount_options['verbose_name'] = self.verbose_name
-            amount_options['name'] = self.name
+            amount_options = {**kwargs,
+                              'verbose_name': self.verbose_name,
+                              'name': self.name}
+        else:
+            # Unpacked into a new dict by the call, no copy needed
+            amount_options = kwargs
 
         self.amount_field = MoneyDecimalField(
             decimal_places=decimal_places,
@@ -365,7 +487,7 @@ class MoneyField(models.Field):
         if not self.fixed_currency:
             # This Moneyfield can have different currencies.
             # Add a currency column to the database
-            self.currency_field = models.CharField(
+            self.currency_field = MoneyCurrencyField(
                 max_length=3,
                 default=currency_default,
                 choices=currency_choices,
@@ -397,15 +519,28 @@ class MoneyField(models.Field):
         cls._meta.money_fields.append(self)
     
     def formfield(self, **kwargs):
+        if not kwargs:
+            # Copying is cheaper than building. Field.__deepcopy__() keeps
+            # "initial" by reference, give each copy its own list.
+            field = copy.deepcopy(self._default_formfield)
+            field.initial = list(field.initial)
+            return field
+        return self._build_formfield(**kwargs)
+
+    @cached_property
+    def _default_formfield(self):
+        return self._build_formfield()
+
+    def _build_formfield(self, **kwargs):
         formfield_amount = self.amount_field.formfield()
-        form_initial = [self.amount_field.default]
         if not self.fixed_currency:
+            form_initial = [self.amount_field.default,
+                            self.currency_field.default]
             formfield_currency = self.currency_field.formfield(
                 validators=[currency_code_validator]
             )
-            form_initial.append(self.currency_field.default)
         else:
-            form_initial.append(self.fixed_currency)
+            form_initial = [self.amount_field.default, self.fixed_currency]
             formfield_currency = FixedCurrencyFormField(
                 currency=self.fixed_currency
             )
@@ -425,3 +560,18 @@ class MoneyField(models.Field):
         config.update(kwargs)
 
         return super().formfield(form_class=MoneyFormField, **config)
+
+
+def inherit_money_fields(sender, **kwargs):
+    """Add the MoneyFields of parent models to the model's _meta.money_fields"""
+    money_fields = list(getattr(sender._meta, 'money_fields', ()))
+    for base in sender.__mro__[1:]:
+        base_opts = getattr(base, '_meta', None)
+        for money_field in getattr(base_opts, 'money_fields', ()):
+            if money_field not in money_fields:
+                money_fields.append(money_field)
+    if money_fields:
+        sender._meta.money_fields = money_fields
+
+
+class_prepared.connect(inherit_money_fields)
@@ -3,6 +3,11 @@ from django.db import models
 from moneyfield import MoneyField
 
 
+class Currency(models.TextChoices):
+    EUR = 'EUR', 'Euro'
+    USD = 'USD', 'US Dollar'
+
+
 class DummyModel(models.Model):
     name = models.CharField(blank=True, max_length=100)
 
@@ -12,6 +17,12 @@ class FixedCurrencyModel(models.Model):
     price = MoneyField(decimal_places=2, max_digits=12, currency='EUR')
 
 
+class FixedCurrencyNoProxyModel(models.Model):
+    name = models.CharField(blank=True, max_length=100)
+    price = MoneyField(decimal_places=2, max_digits=12, currency='EUR',
+                       amount_proxy=False)
+
+
 class FixedCurrencyDefaultAmountModel(models.Model):
     name = models.CharField(blank=True, max_length=100)
     price = MoneyField(decimal_places=2, max_digits=12, currency='EUR', 
@@ -64,4 +75,13 @@ class SomeMoney(models.Model):
     field3 = models.CharField(blank=True, max_length=100)
 
 
+class AbstractMoneyModel(models.Model):
+    price = MoneyField(decimal_places=2, max_digits=12)
+    
+    class Meta:
+        abstract = True
 
+
+class InheritedMoneyModel(AbstractMoneyModel):
+    name = models.CharField(blank=True, max_length=100)
+    tax = MoneyField(decimal_places=2, max_digits=12, currency='EUR')
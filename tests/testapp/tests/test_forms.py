@@ -10,13 +10,58 @@ from moneyfield.fields import MoneyFormField
 from moneyfield import MoneyField, MoneyModelForm
 
 from testapp.models import (DummyModel, FixedCurrencyModel, FreeCurrencyModel,
-                            ChoicesCurrencyModel, SomeMoney)
+                            ChoicesCurrencyModel, SomeMoney,
+                            InheritedMoneyModel)
 
 
 class TestMoneyModelFormOrdering(TestCase):
     def test_field_natural_order(self):
         form = modelform_factory(SomeMoney, form=MoneyModelForm, fields=ALL_FIELDS)()
         self.assertEqual(list(form.fields.keys()), ['field1', 'field2', 'field3'])
+    
+    def test_inherited_moneyfields(self):
+        form = modelform_factory(InheritedMoneyModel, form=MoneyModelForm,
+                                 fields=ALL_FIELDS)()
+        self.assertEqual(list(form.fields.keys()), ['price', 'name', 'tax'])
+    
+    def test_inherited_moneyfields_instance_initial(self):
+        Form = modelform_factory(InheritedMoneyModel, form=MoneyModelForm,
+                                 fields=ALL_FIELDS)
+        instance = InheritedMoneyModel(price_amount=Decimal('1.00'),
+                                       price_currency='USD',
+                                       tax_amount=Decimal('0.20'))
+        form = Form(instance=instance)
+        self.assertEqual(form.initial['price'], Money('1.00', 'USD'))
+        self.assertEqual(form.initial['tax'], Money('0.20', 'EUR'))
+
+
+class TestMoneyFieldFormfield(TestCase):
+    def test_default_formfield_is_a_copy(self):
+        money_field = FreeCurrencyModel.price
+        formfield = money_field.formfield()
+        self.assertIsNot(formfield, money_field.formfield())
+        self.assertEqual(type(formfield), MoneyFormField)
+        self.assertEqual(formfield.initial, money_field.formfield().initial)
+    
+    def test_form_classes_do_not_share_fields(self):
+        FormA = modelform_factory(FreeCurrencyModel, form=MoneyModelForm,
+                                  fields=ALL_FIELDS)
+        FormB = modelform_factory(FreeCurrencyModel, form=MoneyModelForm,
+                                  fields=ALL_FIELDS)
+        FormA.base_fields['price'].required = False
+        FormA.base_fields['price'].label = 'Custom'
+        self.assertTrue(FormB.base_fields['price'].required)
+        self.assertIsNone(FormB.base_fields['price'].label)
+        self.assertNotIn('Custom', FormB().as_p())
+        
+        default_initial = list(FormB.base_fields['price'].initial)
+        FormA.base_fields['price'].initial[0] = Decimal('9.99')
+        FormC = modelform_factory(FreeCurrencyModel, form=MoneyModelForm,
+                                  fields=ALL_FIELDS)
+        self.assertEqual(FormB.base_fields['price'].initial, default_initial)
+        self.assertEqual(FormC.base_fields['price'].initial, default_initial)
+        self.assertEqual(FreeCurrencyModel.price._default_formfield.initial,
+                         default_initial)
 
 
 class TestMoneyModelFormValidation(TestCase):
@@ -144,6 +189,15 @@ class TestFreeCurrencyMoneyModelForm(MoneyModelFormMixin, TestCase):
         html = form.as_p()
         self.assertIn('value="1234.00"', html)
         self.assertIn('value="USD"', html)
+    
+    def test_instance_initial(self):
+        instance = FreeCurrencyModel(price_amount=Decimal('1234.00'),
+                                     price_currency='USD')
+        form = self.Form(instance=instance)
+        self.assertEqual(form.initial['price'], Money('1234.00', 'USD'))
+        html = form.as_p()
+        self.assertIn('value="1234.00"', html)
+        self.assertIn('value="USD"', html)
 
 
 class TestChoicesCurrencyMoneyModelForm(MoneyModelFormMixin, TestCase):
@@ -1,13 +1,20 @@
+import sys
 from decimal import Decimal
+from unittest import mock, skipUnless
 
 from django.db import connection
 from django.db.utils import DatabaseError
 from django.core.exceptions import FieldError, ValidationError
 from django.test import TestCase
+from django.utils import translation
+from django.utils.safestring import mark_safe
 
 from money import Money
 
 from moneyfield import MoneyField
+from moneyfield import fields
+from moneyfield.fields import (BABEL_AVAILABLE, MoneyLC,
+                               currency_code_validator)
 import testapp.models as testmodels
 
 
@@ -81,6 +88,15 @@ class TestFieldValidation(TestCase):
                 default=Money('1234.00', 'EUR'),
             )
     
+    def test_text_choices_fixed_currency(self):
+        testfield = MoneyField(
+            name='testfield',
+            decimal_places=2,
+            max_digits=8,
+            currency=testmodels.Currency.EUR,
+        )
+        self.assertEqual(testfield.fixed_currency, 'EUR')
+    
     def test_invalid_default(self):
         with self.assertRaises(TypeError):
             testfield = MoneyField(
@@ -91,6 +107,67 @@ class TestFieldValidation(TestCase):
             )
 
 
+class TestCurrencyCodeValidator(TestCase):
+    def test_valid_codes(self):
+        for code in ('EUR', 'USD', 'XXX'):
+            currency_code_validator(code)
+    
+    def test_invalid_codes(self):
+        for code in ('', 'EU', 'EURO', 'eur', 'Eur', 'E1R', 'EUR\n', 'ÀBC'):
+            with self.assertRaises(ValidationError):
+                currency_code_validator(code)
+    
+    def test_str_subclass_values(self):
+        currency_code_validator(testmodels.Currency.EUR)
+        currency_code_validator(mark_safe('EUR'))
+    
+    def test_non_str_value(self):
+        with self.assertRaises(ValidationError):
+            currency_code_validator(123)
+
+
+class TestMoneyLC(TestCase):
+    def test_language_locale_follows_active_language(self):
+        value = MoneyLC('1234.00', 'EUR')
+        with translation.override('pt-br'):
+            self.assertEqual(value.language_locale, 'pt_BR')
+        with translation.override('en-us'):
+            self.assertEqual(value.language_locale, 'en_US')
+    
+    @skipUnless(BABEL_AVAILABLE, 'requires Babel 2.2 or higher')
+    def test_str_babel_format(self):
+        with translation.override('en-us'):
+            self.assertEqual(str(MoneyLC('1234.50', 'USD')), '$1,234.50')
+    
+    @skipUnless(BABEL_AVAILABLE, 'requires Babel 2.2 or higher')
+    def test_str_after_unformattable_amount(self):
+        huge = MoneyLC('1e30', 'USD')
+        with translation.override('en-us'):
+            self.assertEqual(str(huge), Money.__str__(huge))
+            self.assertEqual(str(MoneyLC('1234.50', 'USD')), '$1,234.50')
+    
+    def test_str_without_active_language(self):
+        with translation.override(None):
+            self.assertEqual(str(MoneyLC('1.50', 'EUR')), 'EUR 1.50')
+    
+    def test_str_unknown_locale_fallback(self):
+        value = MoneyLC('1234.50', 'USD')
+        with translation.override('xx'):
+            self.assertEqual(str(value), Money.__str__(value))
+            self.assertEqual(str(value), 'USD 1,234.50')
+    
+    @skipUnless(BABEL_AVAILABLE, 'requires Babel 2.2 or higher')
+    def test_str_unknown_locale_cached(self):
+        self.addCleanup(fields._unknown_locales.discard, 'yy')
+        value = MoneyLC('1.50', 'EUR')
+        with translation.override('yy'):
+            self.assertEqual(str(value), 'EUR 1.50')
+            self.assertIn('yy', fields._unknown_locales)
+            with mock.patch.object(MoneyLC, 'format') as format_mock:
+                self.assertEqual(str(MoneyLC('2.50', 'EUR')), 'EUR 2.50')
+            format_mock.assert_not_called()
+
+
 class TestMoneyFieldMixin:
     def setUp(self):
         self.table_name = self.model._meta.db_table
@@ -201,6 +278,26 @@ class TestFixedCurrencyMoneyField(TestMoneyFieldMixin, TestCase):
             obj.price = Money('1234.00', 'USD')
 
 
+class TestFixedCurrencyNoProxyMoneyField(TestCase):
+    model = testmodels.FixedCurrencyNoProxyModel
+    
+    def test_instance_decimal_assignation(self):
+        obj = self.model()
+        obj.price = Decimal('1234.00')
+        obj.save()
+        self.assertEqual(obj.price, Money('1234.00', 'EUR'))
+    
+    def test_invalid_currency_assignation(self):
+        obj = self.model()
+        with self.assertRaises(TypeError):
+            obj.price = Money('1234.00', 'USD')
+    
+    def test_invalid_value_assignation(self):
+        obj = self.model()
+        with self.assertRaises(TypeError):
+            obj.price = '1234.00'
+
+
 class TestFixedCurrencyDefaultAmountMoneyField(TestFixedCurrencyMoneyField):
     model = testmodels.FixedCurrencyDefaultAmountModel
     
@@ -226,6 +323,24 @@ class TestFreeCurrencyMoneyField(TestMoneyFieldMixin, TestCase):
         obj = self.manager_create_instance()
         self.assertEqual(obj.price_currency, 'EUR')
     
+    def test_instance_text_choices_currency(self):
+        obj = self.model()
+        obj.price = Money('1234.00', testmodels.Currency.EUR)
+        obj.save()
+        self.assertEqual(obj.price, Money('1234.00', 'EUR'))
+        obj_retrieved = self.model.objects.get()
+        self.assertEqual(obj_retrieved.price, Money('1234.00', 'EUR'))
+    
+    def test_retrieved_currency_interned(self):
+        self.manager_create_instance()
+        obj_retrieved = self.model.objects.get()
+        self.assertIs(obj_retrieved.price_currency, sys.intern('EUR'))
+    
+    def test_currency_field_deconstruct(self):
+        field = self.model._meta.get_field('price_currency')
+        name, path, args, kwargs = field.deconstruct()
+        self.assertEqual(path, 'django.db.models.CharField')
+    
     def test_query_currency(self):
         obj = self.manager_create_instance()
         results = self.model.objects.filter(price_currency='EUR')
@@ -233,6 +348,21 @@ class TestFreeCurrencyMoneyField(TestMoneyFieldMixin, TestCase):
         self.assertEqual(obj, results[0])
         self.assertEqual(obj.price, results[0].price)
     
+    def test_instance_descriptor_get_unconverted_amount(self):
+        obj = self.model(price_amount='1234.00', price_currency='EUR')
+        self.assertEqual(obj.price, Money('1234.00', 'EUR'))
+        self.assertEqual(type(obj.price.amount), Decimal)
+    
+    def test_instance_descriptor_get_invalid_currency(self):
+        obj = self.model(price_amount=Decimal('1234.00'), price_currency='eur')
+        with self.assertRaises(ValueError):
+            obj.price
+    
+    def test_invalid_decimal_assignation(self):
+        obj = self.model()
+        with self.assertRaises(TypeError):
+            obj.price = Decimal('1234.00')
+    
     def test_invalid_currency_code(self):
         obj = self.manager_create_instance()
         obj.price_currency = "AA"